@@ -1,6 +1,7 @@
-import sys, yaml, ast, pkg_resources
-import numpy as np
+import os, sys, ast, pickle, hashlib
 from copy import deepcopy
+from functools import lru_cache
+from importlib.metadata import version as _package_version
 
 from .utils import version_check
 from GANDLF.data.post_process import postprocessing_after_reverse_one_hot_encoding
@@ -42,6 +43,41 @@ parameter_defaults_string = {
     "clip_mode": None,  # default clip mode
 }
 
+## all top-level defaults as (parameter, value, evaluate) entries, assembled once so that parsing is a single pass
+_parameter_defaults_combined = tuple(
+    (current_parameter, value, True)
+    for current_parameter, value in parameter_defaults.items()
+) + tuple(
+    (current_parameter, value, False)
+    for current_parameter, value in parameter_defaults_string.items()
+)
+
+## dictionary to define the required options, along with the message to show if they are absent
+parameter_required = {
+    "patch_size": "Patch size needs to be defined in the config file",
+    "modality": "'modality' needs to be defined in the config file",
+    "loss_function": "'loss_function' needs to be defined in the config file",
+    "metrics": "'metrics' needs to be defined in the config file",
+    "model": "The 'model' parameter needs to be defined",
+    "nested_training": "The parameter 'nested_training' needs to be defined",
+}
+
+## preprocessing options that threshold or clip intensities, of which only one can be used; this can be extended, as required
+thresholdOrClip_keys = frozenset(("threshold", "clip", "clamp"))
+
+## translation table to strip single and double quotes from the parallel compute command
+_quotes_to_remove = str.maketrans("", "", "'\"")
+
+## dictionary to define defaults for options under 'model'
+model_parameter_defaults = {
+    "class_list": [],  # ensure that this is initialized
+    "ignore_label_validation": None,  # the label to ignore during validation
+    "print_summary": True,  # print the model summary
+    "type": "torch",  # model type for processing
+    "data_type": "FP32",  # openvino model data type for processing
+    "save_at_every_epoch": False,  # default save strategy for model
+}
+
 
 def initialize_parameter(params, parameter_to_initialize, value=None, evaluate=True):
     """
@@ -98,6 +134,100 @@ def initialize_key(parameters, key, value=None):
     return parameters
 
 
+@lru_cache(maxsize=1)
+def _get_installed_gandlf_version():
+    """
+    This function returns the installed version of GaNDLF; the package metadata lookup is only done once per process.
+
+    Returns:
+        str: The installed version of GaNDLF.
+    """
+    return _package_version("GANDLF")
+
+
+@lru_cache(maxsize=1)
+def _get_yaml_loader():
+    """
+    This function imports PyYAML on first use and returns the fastest available safe loader; the libyaml-backed parser is significantly faster than the pure-python one.
+
+    Returns:
+        tuple: The yaml module and the YAML loader class.
+    """
+    import yaml
+
+    if not yaml.__with_libyaml__:
+        print(
+            "WARNING: PyYAML was built without libyaml, falling back to the slower pure-python parser for configuration files",
+            file=sys.stderr,
+        )
+        return yaml, yaml.SafeLoader
+    return yaml, yaml.CSafeLoader
+
+
+def _load_yaml(yaml_data):
+    """
+    This function parses the YAML data using the loader from _get_yaml_loader.
+
+    Args:
+        yaml_data (bytes): The YAML data to parse.
+
+    Returns:
+        dict: The parsed contents.
+    """
+    yaml, loader = _get_yaml_loader()
+    return yaml.load(yaml_data, Loader=loader)
+
+
+def _load_config_file(config_file_path):
+    """
+    This function loads the contents of the configuration file. If the 'GANDLF_CONFIG_CACHE' environment variable is set to '1', the loaded contents are stored in a pickled sidecar file next to the configuration, which is re-used as long as the hash of the configuration file is unchanged.
+
+    Args:
+        config_file_path (str): The filename of the configuration file.
+
+    Returns:
+        dict: The contents of the configuration file.
+    """
+    # hand the raw bytes to the parser, which avoids the chunked reads and decoding of a text stream
+    with open(config_file_path, "rb") as f:
+        file_bytes = f.read()
+
+    if os.environ.get("GANDLF_CONFIG_CACHE") != "1":
+        return _load_yaml(file_bytes)
+
+    file_hash = hashlib.blake2b(file_bytes, digest_size=8).hexdigest()
+    cache_file_path = str(config_file_path) + ".cache.pkl"
+
+    if os.path.isfile(cache_file_path):
+        try:
+            with open(cache_file_path, "rb") as f:
+                cached_config = pickle.load(f)
+            if cached_config["h"] == file_hash:
+                return cached_config["params"]
+        except Exception:
+            # a corrupted or incompatible sidecar is simply regenerated
+            pass
+
+    params = _load_yaml(file_bytes)
+    # write to a process-specific temporary file first and move it into place, so that
+    # parallel jobs sharing this configuration never read a partially written cache
+    cache_file_path_temp = cache_file_path + ".tmp" + str(os.getpid())
+    try:
+        with open(cache_file_path_temp, "wb") as f:
+            pickle.dump({"h": file_hash, "params": params}, f, protocol=5)
+        os.replace(cache_file_path_temp, cache_file_path)
+    except OSError:
+        print(
+            "WARNING: Could not write the configuration cache to '"
+            + cache_file_path
+            + "'",
+            file=sys.stderr,
+        )
+        if os.path.isfile(cache_file_path_temp):
+            os.remove(cache_file_path_temp)
+    return params
+
+
 def _parseConfig(config_file_path, version_check_flag=True):
     """
     This function parses the configuration file and returns a dictionary of parameters.
@@ -111,7 +241,7 @@ def _parseConfig(config_file_path, version_check_flag=True):
     """
     params = config_file_path
     if not isinstance(config_file_path, dict):
-        params = yaml.safe_load(open(config_file_path, "r"))
+        params = _load_config_file(config_file_path)
 
     if version_check_flag:  # this is only to be used for testing
         assert (
@@ -119,32 +249,44 @@ def _parseConfig(config_file_path, version_check_flag=True):
         ), "The 'version' key needs to be defined in config with 'minimum' and 'maximum' fields to determine the compatibility of configuration with code base"
         version_check(
             params["version"],
-            version_to_check=pkg_resources.require("GANDLF")[0].version,
+            version_to_check=_get_installed_gandlf_version(),
         )
 
-    if "patch_size" in params:
-        # duplicate patch size if it is an int or float
-        if isinstance(params["patch_size"], int) or isinstance(
-            params["patch_size"], float
-        ):
-            params["patch_size"] = [params["patch_size"]]
-        # in case someone decides to pass a single value list
-        if len(params["patch_size"]) == 1:
-            actual_patch_size = []
-            for _ in range(params["model"]["dimension"]):
-                actual_patch_size.append(params["patch_size"][0])
-            params["patch_size"] = actual_patch_size
-
-        # parse patch size as needed for computations
-        if len(params["patch_size"]) == 2:  # 2d check
-            # ensuring same size during torchio processing
-            params["patch_size"].append(1)
-            if "dimension" not in params["model"]:
-                params["model"]["dimension"] = 2
-        elif len(params["patch_size"]) == 3:  # 2d check
-            if "dimension" not in params["model"]:
-                params["model"]["dimension"] = 3
-    assert "patch_size" in params, "Patch size needs to be defined in the config file"
+    # ensure that all the required options are present before any processing
+    for current_parameter in parameter_required:
+        assert current_parameter in params, parameter_required[current_parameter]
+    assert isinstance(
+        params["model"], dict
+    ), "The 'model' parameter needs to be populated as a dictionary"
+    assert (
+        len(params["model"]) > 0
+    ), "The 'model' parameter needs to be populated as a dictionary and should have all properties present"
+    assert (
+        "architecture" in params["model"]
+    ), "The 'model' parameter needs 'architecture' to be defined"
+    assert (
+        "final_layer" in params["model"]
+    ), "The 'model' parameter needs 'final_layer' to be defined"
+
+    # duplicate patch size if it is an int or float
+    if isinstance(params["patch_size"], int) or isinstance(params["patch_size"], float):
+        params["patch_size"] = [params["patch_size"]]
+    # in case someone decides to pass a single value list
+    if len(params["patch_size"]) == 1:
+        actual_patch_size = []
+        for _ in range(params["model"]["dimension"]):
+            actual_patch_size.append(params["patch_size"][0])
+        params["patch_size"] = actual_patch_size
+
+    # parse patch size as needed for computations
+    if len(params["patch_size"]) == 2:  # 2d check
+        # ensuring same size during torchio processing
+        params["patch_size"].append(1)
+        if "dimension" not in params["model"]:
+            params["model"]["dimension"] = 2
+    elif len(params["patch_size"]) == 3:  # 2d check
+        if "dimension" not in params["model"]:
+            params["model"]["dimension"] = 3
 
     if "resize" in params:
         print(
@@ -152,7 +294,6 @@ def _parseConfig(config_file_path, version_check_flag=True):
             file=sys.stderr,
         )
 
-    assert "modality" in params, "'modality' needs to be defined in the config file"
     params["modality"] = params["modality"].lower()
     assert params["modality"] in [
         "rad",
@@ -160,353 +301,322 @@ def _parseConfig(config_file_path, version_check_flag=True):
         "path",
     ], "Modality should be either 'rad' or 'path'"
 
-    assert (
-        "loss_function" in params
-    ), "'loss_function' needs to be defined in the config file"
-    if "loss_function" in params:
-        # check if user has passed a dict
-        if isinstance(params["loss_function"], dict):  # if this is a dict
-            if len(params["loss_function"]) > 0:  # only proceed if something is defined
-                for key in params["loss_function"]:  # iterate through all keys
-                    if key == "mse":
-                        if (params["loss_function"][key] is None) or not (
-                            "reduction" in params["loss_function"][key]
-                        ):
-                            params["loss_function"][key] = {}
-                            params["loss_function"][key]["reduction"] = "mean"
-                    else:
-                        # use simple string for other functions - can be extended with parameters, if needed
-                        params["loss_function"] = key
-        else:
-            # check if user has passed a single string
-            if params["loss_function"] == "mse":
-                params["loss_function"] = {}
-                params["loss_function"]["mse"] = {}
-                params["loss_function"]["mse"]["reduction"] = "mean"
-            elif params["loss_function"] == "focal":
-                params["loss_function"] = {}
-                params["loss_function"]["focal"] = {}
-                params["loss_function"]["focal"]["gamma"] = 2.0
-                params["loss_function"]["focal"]["size_average"] = True
-
-    assert "metrics" in params, "'metrics' needs to be defined in the config file"
-    if "metrics" in params:
-        if not isinstance(params["metrics"], dict):
-            temp_dict = {}
-        else:
-            temp_dict = params["metrics"]
-
-        # initialize metrics dict
-        for metric in params["metrics"]:
-            # assigning a new variable because some metrics can be dicts, and we want to get the first key
-            comparison_string = metric
-            if isinstance(metric, dict):
-                comparison_string = list(metric.keys())[0]
-            # these metrics always need to be dicts
-            if comparison_string in [
-                "accuracy",
-                "f1",
-                "precision",
-                "recall",
-                "specificity",
-                "iou",
-            ]:
-                if not isinstance(metric, dict):
-                    temp_dict[metric] = {}
+    loss_function = params["loss_function"]
+    # check if user has passed a dict
+    if isinstance(loss_function, dict):  # if this is a dict
+        if len(loss_function) > 0:  # only proceed if something is defined
+            for key in loss_function:  # iterate through all keys
+                if key == "mse":
+                    if (loss_function[key] is None) or not (
+                        "reduction" in loss_function[key]
+                    ):
+                        loss_function[key] = {"reduction": "mean"}
                 else:
-                    temp_dict[comparison_string] = metric
-            elif not isinstance(metric, dict):
-                temp_dict[metric] = None
-
-            # special case for accuracy, precision, recall, and specificity; which could be dicts
-            ## need to find a better way to do this
-            if any(
-                _ in comparison_string
-                for _ in ["precision", "recall", "specificity", "accuracy", "f1"]
-            ):
-                if comparison_string != "classification_accuracy":
-                    temp_dict[comparison_string] = initialize_key(
-                        temp_dict[comparison_string], "average", "weighted"
-                    )
-                    temp_dict[comparison_string] = initialize_key(
-                        temp_dict[comparison_string], "multi_class", True
-                    )
-                    temp_dict[comparison_string] = initialize_key(
-                        temp_dict[comparison_string], "mdmc_average", "samplewise"
-                    )
-                    temp_dict[comparison_string] = initialize_key(
-                        temp_dict[comparison_string], "threshold", 0.5
-                    )
-                    if comparison_string == "accuracy":
-                        temp_dict[comparison_string] = initialize_key(
-                            temp_dict[comparison_string], "subset_accuracy", False
-                        )
-            elif "iou" in comparison_string:
-                temp_dict["iou"] = initialize_key(
-                    temp_dict["iou"], "reduction", "elementwise_mean"
+                    # use simple string for other functions - can be extended with parameters, if needed
+                    params["loss_function"] = key
+    else:
+        # check if user has passed a single string
+        if loss_function == "mse":
+            params["loss_function"] = {"mse": {"reduction": "mean"}}
+        elif loss_function == "focal":
+            params["loss_function"] = {"focal": {"gamma": 2.0, "size_average": True}}
+
+    if not isinstance(params["metrics"], dict):
+        temp_dict = {}
+    else:
+        temp_dict = params["metrics"]
+
+    # initialize metrics dict
+    for metric in params["metrics"]:
+        # assigning a new variable because some metrics can be dicts, and we want to get the first key
+        comparison_string = metric
+        if isinstance(metric, dict):
+            comparison_string = list(metric.keys())[0]
+        # these metrics always need to be dicts
+        if comparison_string in [
+            "accuracy",
+            "f1",
+            "precision",
+            "recall",
+            "specificity",
+            "iou",
+        ]:
+            if not isinstance(metric, dict):
+                temp_dict[metric] = {}
+            else:
+                temp_dict[comparison_string] = metric
+        elif not isinstance(metric, dict):
+            temp_dict[metric] = None
+
+        # special case for accuracy, precision, recall, and specificity; which could be dicts
+        ## need to find a better way to do this
+        if any(
+            _ in comparison_string
+            for _ in ["precision", "recall", "specificity", "accuracy", "f1"]
+        ):
+            if comparison_string != "classification_accuracy":
+                temp_dict[comparison_string] = initialize_key(
+                    temp_dict[comparison_string], "average", "weighted"
+                )
+                temp_dict[comparison_string] = initialize_key(
+                    temp_dict[comparison_string], "multi_class", True
                 )
-                temp_dict["iou"] = initialize_key(temp_dict["iou"], "threshold", 0.5)
-            elif comparison_string in surface_distance_ids:
                 temp_dict[comparison_string] = initialize_key(
-                    temp_dict[comparison_string], "connectivity", 1
+                    temp_dict[comparison_string], "mdmc_average", "samplewise"
                 )
                 temp_dict[comparison_string] = initialize_key(
-                    temp_dict[comparison_string], "threshold", None
+                    temp_dict[comparison_string], "threshold", 0.5
                 )
+                if comparison_string == "accuracy":
+                    temp_dict[comparison_string] = initialize_key(
+                        temp_dict[comparison_string], "subset_accuracy", False
+                    )
+        elif "iou" in comparison_string:
+            temp_dict["iou"] = initialize_key(
+                temp_dict["iou"], "reduction", "elementwise_mean"
+            )
+            temp_dict["iou"] = initialize_key(temp_dict["iou"], "threshold", 0.5)
+        elif comparison_string in surface_distance_ids:
+            temp_dict[comparison_string] = initialize_key(
+                temp_dict[comparison_string], "connectivity", 1
+            )
+            temp_dict[comparison_string] = initialize_key(
+                temp_dict[comparison_string], "threshold", None
+            )
 
-        params["metrics"] = temp_dict
+    params["metrics"] = temp_dict
 
     # this is NOT a required parameter - a user should be able to train with NO augmentations
-    params = initialize_key(params, "data_augmentation", {})
+    # an explicitly empty section (i.e., 'data_augmentation:' without any values) is treated as no augmentations
+    params["data_augmentation"] = params.get("data_augmentation") or {}
+    data_augmentation = params["data_augmentation"]
     # for all others, ensure probability is present
-    params["data_augmentation"]["default_probability"] = params[
-        "data_augmentation"
-    ].get("default_probability", 0.5)
-
-    if not (params["data_augmentation"] is None):
-        if len(params["data_augmentation"]) > 0:  # only when augmentations are defined
-            # special case for random swapping and elastic transformations - which takes a patch size for computation
-            for key in ["swap", "elastic"]:
-                if key in params["data_augmentation"]:
-                    params["data_augmentation"][key] = initialize_key(
-                        params["data_augmentation"][key],
-                        "patch_size",
-                        np.round(np.array(params["patch_size"]) / 10)
-                        .astype("int")
-                        .tolist(),
-                    )
+    default_probability = data_augmentation.setdefault("default_probability", 0.5)
+
+    # special case for random swapping and elastic transformations - which takes a patch size for computation
+    for key in ["swap", "elastic"]:
+        if key in data_augmentation:
+            data_augmentation[key] = initialize_key(
+                data_augmentation[key],
+                "patch_size",
+                [round(dim / 10) for dim in params["patch_size"]],
+            )
 
-            # special case for swap default initialization
-            if "swap" in params["data_augmentation"]:
-                params["data_augmentation"]["swap"] = initialize_key(
-                    params["data_augmentation"]["swap"], "num_iterations", 100
-                )
+    # special case for swap default initialization
+    if "swap" in data_augmentation:
+        data_augmentation["swap"] = initialize_key(
+            data_augmentation["swap"], "num_iterations", 100
+        )
 
-            # special case for affine default initialization
-            if "affine" in params["data_augmentation"]:
-                params["data_augmentation"]["affine"] = initialize_key(
-                    params["data_augmentation"]["affine"], "scales", 0.1
-                )
-                params["data_augmentation"]["affine"] = initialize_key(
-                    params["data_augmentation"]["affine"], "degrees", 15
-                )
-                params["data_augmentation"]["affine"] = initialize_key(
-                    params["data_augmentation"]["affine"], "translation", 2
-                )
+    # special case for affine default initialization
+    if "affine" in data_augmentation:
+        data_augmentation["affine"] = initialize_key(
+            data_augmentation["affine"], "scales", 0.1
+        )
+        data_augmentation["affine"] = initialize_key(
+            data_augmentation["affine"], "degrees", 15
+        )
+        data_augmentation["affine"] = initialize_key(
+            data_augmentation["affine"], "translation", 2
+        )
 
-            if "motion" in params["data_augmentation"]:
-                params["data_augmentation"]["motion"] = initialize_key(
-                    params["data_augmentation"]["motion"], "num_transforms", 2
-                )
-                params["data_augmentation"]["motion"] = initialize_key(
-                    params["data_augmentation"]["motion"], "degrees", 15
-                )
-                params["data_augmentation"]["motion"] = initialize_key(
-                    params["data_augmentation"]["motion"], "translation", 2
-                )
-                params["data_augmentation"]["motion"] = initialize_key(
-                    params["data_augmentation"]["motion"], "interpolation", "linear"
-                )
+    if "motion" in data_augmentation:
+        data_augmentation["motion"] = initialize_key(
+            data_augmentation["motion"], "num_transforms", 2
+        )
+        data_augmentation["motion"] = initialize_key(
+            data_augmentation["motion"], "degrees", 15
+        )
+        data_augmentation["motion"] = initialize_key(
+            data_augmentation["motion"], "translation", 2
+        )
+        data_augmentation["motion"] = initialize_key(
+            data_augmentation["motion"], "interpolation", "linear"
+        )
 
-            # special case for random blur/noise - which takes a std-dev range
-            for std_aug in ["blur", "noise_var"]:
-                if std_aug in params["data_augmentation"]:
-                    params["data_augmentation"][std_aug] = initialize_key(
-                        params["data_augmentation"][std_aug], "std", None
-                    )
-            for std_aug in ["noise"]:
-                if std_aug in params["data_augmentation"]:
-                    params["data_augmentation"][std_aug] = initialize_key(
-                        params["data_augmentation"][std_aug], "std", [0, 1]
-                    )
+    # special case for random blur/noise - which takes a std-dev range
+    for std_aug in ["blur", "noise_var"]:
+        if std_aug in data_augmentation:
+            data_augmentation[std_aug] = initialize_key(
+                data_augmentation[std_aug], "std", None
+            )
+    for std_aug in ["noise"]:
+        if std_aug in data_augmentation:
+            data_augmentation[std_aug] = initialize_key(
+                data_augmentation[std_aug], "std", [0, 1]
+            )
 
-            # special case for random noise - which takes a mean range
-            for mean_aug in ["noise", "noise_var"]:
-                if mean_aug in params["data_augmentation"]:
-                    params["data_augmentation"][mean_aug] = initialize_key(
-                        params["data_augmentation"][mean_aug], "mean", 0
-                    )
+    # special case for random noise - which takes a mean range
+    for mean_aug in ["noise", "noise_var"]:
+        if mean_aug in data_augmentation:
+            data_augmentation[mean_aug] = initialize_key(
+                data_augmentation[mean_aug], "mean", 0
+            )
 
-            # special case for augmentations that need axis defined
-            for axis_aug in ["flip", "anisotropic", "rotate_90", "rotate_180"]:
-                if axis_aug in params["data_augmentation"]:
-                    params["data_augmentation"][axis_aug] = initialize_key(
-                        params["data_augmentation"][axis_aug], "axis", [0, 1, 2]
-                    )
+    # special case for augmentations that need axis defined
+    for axis_aug in ["flip", "anisotropic", "rotate_90", "rotate_180"]:
+        if axis_aug in data_augmentation:
+            data_augmentation[axis_aug] = initialize_key(
+                data_augmentation[axis_aug], "axis", [0, 1, 2]
+            )
 
-            # special case for colorjitter
-            if "colorjitter" in params["data_augmentation"]:
-                params["data_augmentation"] = initialize_key(
-                    params["data_augmentation"], "colorjitter", {}
-                )
-                for key in ["brightness", "contrast", "saturation"]:
-                    params["data_augmentation"]["colorjitter"] = initialize_key(
-                        params["data_augmentation"]["colorjitter"], key, [0, 1]
-                    )
-                params["data_augmentation"]["colorjitter"] = initialize_key(
-                    params["data_augmentation"]["colorjitter"], "hue", [-0.5, 0.5]
-                )
+    # special case for colorjitter
+    if "colorjitter" in data_augmentation:
+        data_augmentation = initialize_key(data_augmentation, "colorjitter", {})
+        for key in ["brightness", "contrast", "saturation"]:
+            data_augmentation["colorjitter"] = initialize_key(
+                data_augmentation["colorjitter"], key, [0, 1]
+            )
+        data_augmentation["colorjitter"] = initialize_key(
+            data_augmentation["colorjitter"], "hue", [-0.5, 0.5]
+        )
 
-            # Added HED augmentation in gandlf
-            hed_augmentation_types = [
-                "hed_transform",
-                # "hed_transform_light",
-                # "hed_transform_heavy",
+    # Added HED augmentation in gandlf
+    hed_augmentation_types = [
+        "hed_transform",
+        # "hed_transform_light",
+        # "hed_transform_heavy",
+    ]
+    for augmentation_type in hed_augmentation_types:
+        if augmentation_type in data_augmentation:
+            data_augmentation = initialize_key(data_augmentation, "hed_transform", {})
+            ranges = [
+                "haematoxylin_bias_range",
+                "eosin_bias_range",
+                "dab_bias_range",
+                "haematoxylin_sigma_range",
+                "eosin_sigma_range",
+                "dab_sigma_range",
             ]
-            for augmentation_type in hed_augmentation_types:
-                if augmentation_type in params["data_augmentation"]:
-                    params["data_augmentation"] = initialize_key(
-                        params["data_augmentation"], "hed_transform", {}
-                    )
-                    ranges = [
-                        "haematoxylin_bias_range",
-                        "eosin_bias_range",
-                        "dab_bias_range",
-                        "haematoxylin_sigma_range",
-                        "eosin_sigma_range",
-                        "dab_sigma_range",
-                    ]
-
-                    default_range = (
-                        [-0.1, 0.1]
-                        if augmentation_type == "hed_transform"
-                        else [-0.03, 0.03]
-                        if augmentation_type == "hed_transform_light"
-                        else [-0.95, 0.95]
-                    )
 
-                    for key in ranges:
-                        params["data_augmentation"]["hed_transform"] = initialize_key(
-                            params["data_augmentation"]["hed_transform"],
-                            key,
-                            default_range,
-                        )
-
-                    params["data_augmentation"]["hed_transform"] = initialize_key(
-                        params["data_augmentation"]["hed_transform"],
-                        "cutoff_range",
-                        [0, 1],
-                    )
+            default_range = (
+                [-0.1, 0.1]
+                if augmentation_type == "hed_transform"
+                else [-0.03, 0.03]
+                if augmentation_type == "hed_transform_light"
+                else [-0.95, 0.95]
+            )
 
-            # special case for anisotropic
-            if "anisotropic" in params["data_augmentation"]:
-                if not ("downsampling" in params["data_augmentation"]["anisotropic"]):
-                    default_downsampling = 1.5
-                else:
-                    default_downsampling = params["data_augmentation"]["anisotropic"][
-                        "downsampling"
-                    ]
-
-                initialize_downsampling = False
-                if isinstance(default_downsampling, list):
-                    if len(default_downsampling) != 2:
-                        initialize_downsampling = True
-                        print(
-                            "WARNING: 'anisotropic' augmentation needs to be either a single number of a list of 2 numbers: https://torchio.readthedocs.io/transforms/augmentation.html?highlight=randomswap#torchio.transforms.RandomAnisotropy.",
-                            file=sys.stderr,
-                        )
-                        default_downsampling = default_downsampling[0]  # only
-                else:
-                    initialize_downsampling = True
-
-                if initialize_downsampling:
-                    if default_downsampling < 1:
-                        print(
-                            "WARNING: 'anisotropic' augmentation needs the 'downsampling' parameter to be greater than 1, defaulting to 1.5.",
-                            file=sys.stderr,
-                        )
-                        # default
-                    params["data_augmentation"]["anisotropic"]["downsampling"] = 1.5
-
-            for key in params["data_augmentation"]:
-                if key != "default_probability":
-                    params["data_augmentation"][key] = initialize_key(
-                        params["data_augmentation"][key],
-                        "probability",
-                        params["data_augmentation"]["default_probability"],
-                    )
+            for key in ranges:
+                data_augmentation["hed_transform"] = initialize_key(
+                    data_augmentation["hed_transform"],
+                    key,
+                    default_range,
+                )
+
+            data_augmentation["hed_transform"] = initialize_key(
+                data_augmentation["hed_transform"],
+                "cutoff_range",
+                [0, 1],
+            )
+
+    # special case for anisotropic
+    if "anisotropic" in data_augmentation:
+        if not ("downsampling" in data_augmentation["anisotropic"]):
+            default_downsampling = 1.5
+        else:
+            default_downsampling = data_augmentation["anisotropic"]["downsampling"]
+
+        initialize_downsampling = False
+        if isinstance(default_downsampling, list):
+            if len(default_downsampling) != 2:
+                initialize_downsampling = True
+                print(
+                    "WARNING: 'anisotropic' augmentation needs to be either a single number of a list of 2 numbers: https://torchio.readthedocs.io/transforms/augmentation.html?highlight=randomswap#torchio.transforms.RandomAnisotropy.",
+                    file=sys.stderr,
+                )
+                default_downsampling = default_downsampling[0]  # only
+        else:
+            initialize_downsampling = True
+
+        if initialize_downsampling:
+            if default_downsampling < 1:
+                print(
+                    "WARNING: 'anisotropic' augmentation needs the 'downsampling' parameter to be greater than 1, defaulting to 1.5.",
+                    file=sys.stderr,
+                )
+                # default
+            data_augmentation["anisotropic"]["downsampling"] = 1.5
+
+    for key in data_augmentation:
+        if key != "default_probability":
+            if data_augmentation[key] is None:
+                data_augmentation[key] = {}
+            data_augmentation[key].setdefault("probability", default_probability)
 
     # this is NOT a required parameter - a user should be able to train with NO built-in pre-processing
     params = initialize_key(params, "data_preprocessing", {})
-    if not (params["data_preprocessing"] is None):
+    data_preprocessing = params["data_preprocessing"]
+    if not (data_preprocessing is None):
         # perform this only when pre-processing is defined
-        if len(params["data_preprocessing"]) > 0:
-            thresholdOrClip = False
-            # this can be extended, as required
-            thresholdOrClipDict = [
-                "threshold",
-                "clip",
-                "clamp",
-            ]
-
+        if len(data_preprocessing) > 0:
             resize_requested = False
-            temp_dict = deepcopy(params["data_preprocessing"])
-            for key in params["data_preprocessing"]:
+            temp_dict = deepcopy(data_preprocessing)
+            for key in data_preprocessing:
                 if key in ["resize", "resize_image", "resize_images", "resize_patch"]:
                     resize_requested = True
 
                 if key in ["resample_min", "resample_minimum"]:
-                    if "resolution" in params["data_preprocessing"][key]:
+                    if "resolution" in data_preprocessing[key]:
                         resize_requested = True
-                        resolution_temp = np.array(
-                            params["data_preprocessing"][key]["resolution"]
-                        )
-                        if resolution_temp.size == 1:
-                            temp_dict[key]["resolution"] = np.array(
-                                [resolution_temp, resolution_temp]
-                            ).tolist()
+                        resolution_temp = data_preprocessing[key]["resolution"]
+                        if isinstance(resolution_temp, list):
+                            if len(resolution_temp) == 1:
+                                resolution_temp = resolution_temp[0]
+                        if not isinstance(resolution_temp, list):
+                            temp_dict[key]["resolution"] = [
+                                resolution_temp,
+                                resolution_temp,
+                            ]
                     else:
                         temp_dict.pop(key)
 
             params["data_preprocessing"] = temp_dict
+            data_preprocessing = temp_dict
 
-            if resize_requested and "resample" in params["data_preprocessing"]:
+            if resize_requested and "resample" in data_preprocessing:
                 for key in ["resize", "resize_image", "resize_images", "resize_patch"]:
-                    if key in params["data_preprocessing"]:
-                        params["data_preprocessing"].pop(key)
+                    if key in data_preprocessing:
+                        data_preprocessing.pop(key)
 
                 print(
                     "WARNING: Different 'resize' operations are ignored as 'resample' is defined under 'data_processing'",
                     file=sys.stderr,
                 )
 
-            # iterate through all keys
-            for key in params["data_preprocessing"]:  # iterate through all keys
-                # for threshold or clip, ensure min and max are defined
-                if not thresholdOrClip:
-                    if key in thresholdOrClipDict:
-                        thresholdOrClip = True  # we only allow one of threshold or clip to occur and not both
-                        # initialize if nothing is present
-                        if not (isinstance(params["data_preprocessing"][key], dict)):
-                            params["data_preprocessing"][key] = {}
-
-                        # if one of the required parameters is not present, initialize with lowest/highest possible values
-                        # this ensures the absence of a field doesn't affect processing
-                        if not "min" in params["data_preprocessing"][key]:
-                            params["data_preprocessing"][key][
-                                "min"
-                            ] = sys.float_info.min
-                        if not "max" in params["data_preprocessing"][key]:
-                            params["data_preprocessing"][key][
-                                "max"
-                            ] = sys.float_info.max
-                elif key in thresholdOrClipDict:
-                    sys.exit("Use only 'threshold' or 'clip', not both")
+            # we only allow one of threshold or clip to occur and not both
+            thresholdOrClip_requested = thresholdOrClip_keys & data_preprocessing.keys()
+            if len(thresholdOrClip_requested) > 1:
+                sys.exit("Use only 'threshold' or 'clip', not both")
+            # for threshold or clip, ensure min and max are defined
+            for key in thresholdOrClip_requested:
+                # initialize if nothing is present
+                if not (isinstance(data_preprocessing[key], dict)):
+                    data_preprocessing[key] = {}
+
+                # if one of the required parameters is not present, initialize with lowest/highest possible values
+                # this ensures the absence of a field doesn't affect processing
+                if not "min" in data_preprocessing[key]:
+                    data_preprocessing[key]["min"] = sys.float_info.min
+                if not "max" in data_preprocessing[key]:
+                    data_preprocessing[key]["max"] = sys.float_info.max
 
+            # iterate through all keys
+            for key in data_preprocessing:  # iterate through all keys
                 if key == "histogram_matching":
-                    if params["data_preprocessing"][key] is not False:
-                        if not (isinstance(params["data_preprocessing"][key], dict)):
-                            params["data_preprocessing"][key] = {}
+                    if data_preprocessing[key] is not False:
+                        if not (isinstance(data_preprocessing[key], dict)):
+                            data_preprocessing[key] = {}
 
                 if key == "histogram_equalization":
-                    if params["data_preprocessing"][key] is not False:
+                    if data_preprocessing[key] is not False:
                         # if histogram equalization is enabled, call histogram_matching
-                        params["data_preprocessing"]["histogram_matching"] = {}
+                        data_preprocessing["histogram_matching"] = {}
 
                 if key == "adaptive_histogram_equalization":
-                    if params["data_preprocessing"][key] is not False:
+                    if data_preprocessing[key] is not False:
                         # if histogram equalization is enabled, call histogram_matching
-                        params["data_preprocessing"]["histogram_matching"] = {
+                        data_preprocessing["histogram_matching"] = {
                             "target": "adaptive"
                         }
 
@@ -523,80 +633,57 @@ def _parseConfig(config_file_path, version_check_flag=True):
             ][key]
             params["data_postprocessing"].pop(key)
 
-    if "model" in params:
-        assert isinstance(
-            params["model"], dict
-        ), "The 'model' parameter needs to be populated as a dictionary"
-        assert (
-            len(params["model"]) > 0
-        ), "The 'model' parameter needs to be populated as a dictionary and should have all properties present"
-        assert (
-            "architecture" in params["model"]
-        ), "The 'model' parameter needs 'architecture' to be defined"
-        assert (
-            "final_layer" in params["model"]
-        ), "The 'model' parameter needs 'final_layer' to be defined"
-        assert (
-            "dimension" in params["model"]
-        ), "The 'model' parameter needs 'dimension' to be defined"
-
-        if "amp" in params["model"]:
-            pass
-        else:
-            print("NOT using Mixed Precision Training")
-            params["model"]["amp"] = False
-
-        if "norm_type" in params["model"]:
-            if (
-                params["model"]["norm_type"] == None
-                or params["model"]["norm_type"].lower() == "none"
-            ):
-                if not ("vgg" in params["model"]["architecture"]):
-                    raise ValueError(
-                        "Normalization type cannot be 'None' for non-VGG architectures"
-                    )
-        else:
-            print("WARNING: Initializing 'norm_type' as 'batch'", flush=True)
-            params["model"]["norm_type"] = "batch"
-
-        if not ("base_filters" in params["model"]):
-            base_filters = 32
-            params["model"]["base_filters"] = base_filters
-            print("Using default 'base_filters' in 'model': ", base_filters)
-        if not ("class_list" in params["model"]):
-            params["model"]["class_list"] = []  # ensure that this is initialized
-        if not ("ignore_label_validation" in params["model"]):
-            params["model"]["ignore_label_validation"] = None
-        if "batch_norm" in params["model"]:
-            print(
-                "WARNING: 'batch_norm' is no longer supported, please use 'norm_type' in 'model' instead",
-                flush=True,
-            )
-        params["model"]["print_summary"] = params["model"].get("print_summary", True)
-
-        channel_keys_to_check = ["n_channels", "channels", "model_channels"]
-        for key in channel_keys_to_check:
-            if key in params["model"]:
-                params["model"]["num_channels"] = params["model"][key]
-                break
-
-        # initialize model type for processing: if not defined, default to torch
-        if not ("type" in params["model"]):
-            params["model"]["type"] = "torch"
+    assert (
+        "dimension" in params["model"]
+    ), "The 'model' parameter needs 'dimension' to be defined"
 
-        # initialize openvino model data type for processing: if not defined, default to FP32
-        if not ("data_type" in params["model"]):
-            params["model"]["data_type"] = "FP32"
+    if "amp" in params["model"]:
+        pass
+    else:
+        print("NOT using Mixed Precision Training")
+        params["model"]["amp"] = False
 
-        # set default save strategy for model
-        if not ("save_at_every_epoch" in params["model"]):
-            params["model"]["save_at_every_epoch"] = False
+    if "norm_type" in params["model"]:
+        if (
+            params["model"]["norm_type"] == None
+            or params["model"]["norm_type"].lower() == "none"
+        ):
+            if not ("vgg" in params["model"]["architecture"]):
+                raise ValueError(
+                    "Normalization type cannot be 'None' for non-VGG architectures"
+                )
+    else:
+        print("WARNING: Initializing 'norm_type' as 'batch'", flush=True)
+        params["model"]["norm_type"] = "batch"
+
+    if not ("base_filters" in params["model"]):
+        base_filters = 32
+        params["model"]["base_filters"] = base_filters
+        print("Using default 'base_filters' in 'model': ", base_filters)
+    if "batch_norm" in params["model"]:
+        print(
+            "WARNING: 'batch_norm' is no longer supported, please use 'norm_type' in 'model' instead",
+            flush=True,
+        )
 
-        if params["model"]["save_at_every_epoch"]:
-            print(
-                "WARNING: 'save_at_every_epoch' will result in TREMENDOUS storage usage; use at your own risk."
+    channel_keys_to_check = ["n_channels", "channels", "model_channels"]
+    for key in channel_keys_to_check:
+        if key in params["model"]:
+            params["model"]["num_channels"] = params["model"][key]
+            break
+
+    # define defaults for model
+    for current_parameter in model_parameter_defaults:
+        if not (current_parameter in params["model"]):
+            params["model"][current_parameter] = deepcopy(
+                model_parameter_defaults[current_parameter]
             )
 
+    if params["model"]["save_at_every_epoch"]:
+        print(
+            "WARNING: 'save_at_every_epoch' will result in TREMENDOUS storage usage; use at your own risk."
+        )
+
     if isinstance(params["model"]["class_list"], str):
         if ("||" in params["model"]["class_list"]) or (
             "&&" in params["model"]["class_list"]
@@ -618,21 +705,15 @@ def _parseConfig(config_file_path, version_check_flag=True):
             except AssertionError:
                 raise AssertionError("Could not evaluate the 'class_list' in 'model'")
 
-    assert (
-        "nested_training" in params
-    ), "The parameter 'nested_training' needs to be defined"
     # initialize defaults for nested training
-    params["nested_training"]["testing"] = params["nested_training"].get("testing", -5)
-    params["nested_training"]["validation"] = params["nested_training"].get(
-        "validation", -5
-    )
+    nested_training = params["nested_training"]
+    nested_training["testing"] = nested_training.get("testing", -5)
+    nested_training["validation"] = nested_training.get("validation", -5)
 
-    parallel_compute_command = ""
-    if "parallel_compute_command" in params:
-        parallel_compute_command = params["parallel_compute_command"]
-        parallel_compute_command = parallel_compute_command.replace("'", "")
-        parallel_compute_command = parallel_compute_command.replace('"', "")
-    params["parallel_compute_command"] = parallel_compute_command
+    # remove all quotes from the command in a single pass
+    params["parallel_compute_command"] = params.get(
+        "parallel_compute_command", ""
+    ).translate(_quotes_to_remove)
 
     if "opt" in params:
         print("DeprecationWarning: 'opt' has been superseded by 'optimizer'")
@@ -663,18 +744,8 @@ def _parseConfig(config_file_path, version_check_flag=True):
     del temp_patch_sampler_dict
 
     # define defaults
-    for current_parameter in parameter_defaults:
-        params = initialize_parameter(
-            params, current_parameter, parameter_defaults[current_parameter], True
-        )
-
-    for current_parameter in parameter_defaults_string:
-        params = initialize_parameter(
-            params,
-            current_parameter,
-            parameter_defaults_string[current_parameter],
-            False,
-        )
+    for current_parameter, value, evaluate in _parameter_defaults_combined:
+        params = initialize_parameter(params, current_parameter, value, evaluate)
 
     # ensure that the scheduler and optimizer are dicts
     if isinstance(params["scheduler"], str):
@@ -716,6 +787,24 @@ def _parseConfig(config_file_path, version_check_flag=True):
     return params
 
 
+@lru_cache(maxsize=32)
+def _parseConfig_cached(config_cache_key):
+    """
+    This function parses the configuration file once per unique cache key; the file modification time and size ensure that edits to the file are picked up.
+
+    Args:
+        config_cache_key (tuple): The absolute path, modification time (ns), size and version check flag of the configuration file.
+
+    Returns:
+        bytes: The pickled parameter dictionary, which is immutable and can be shared safely.
+    """
+    config_file_path, _, _, version_check_flag = config_cache_key
+    return pickle.dumps(
+        _parseConfig(config_file_path, version_check_flag),
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+
+
 def ConfigManager(config_file_path, version_check_flag=True) -> None:
     """
     This function parses the configuration file and returns a dictionary of parameters.
@@ -727,4 +816,18 @@ def ConfigManager(config_file_path, version_check_flag=True) -> None:
     Returns:
         dict: The parameter dictionary.
     """
-    return _parseConfig(config_file_path, version_check_flag)
+    if isinstance(config_file_path, dict):
+        return _parseConfig(config_file_path, version_check_flag)
+
+    file_stats = os.stat(config_file_path)
+    config_cache_key = (
+        os.path.abspath(config_file_path),
+        file_stats.st_mtime_ns,
+        file_stats.st_size,
+        version_check_flag,
+    )
+    # callers are free to modify the returned parameters, so every call gets its own copy; unpickling is much cheaper than a deepcopy
+    return pickle.loads(_parseConfig_cached(config_cache_key))
+
+
+ConfigManager.cache_clear = _parseConfig_cached.cache_clear
@@ -102,19 +102,16 @@ def get_filename_extension_sanitized(filename):
 
 def parse_version(version_string):
     """
-    Parses version string, discards last identifier (NR/alpha/beta) and returns an integer for comparison.
+    Parses version string, discards last identifier (NR/alpha/beta) and returns a tuple of integers for comparison.
 
     Args:
         version_string (str): The string to be parsed.
 
     Returns:
-        int: The version number.
+        tuple: The version number as (major, minor, patch).
     """
-    version_string_split = version_string.replace("-dev", "")
-    version_string_split = version_string_split.split(".")
-    if len(version_string_split) > 3:
-        del version_string_split[-1]
-    return int("".join(version_string_split))
+    version_string_split = version_string.replace("-dev", "").split(".")[:3]
+    return tuple(int(version_part) for version_part in version_string_split)
 
 
 def version_check(version_from_config, version_to_check):
@@ -128,15 +125,11 @@ def version_check(version_from_config, version_to_check):
     Returns:
         bool: If the version of the config file is compatible with the version of the code.
     """
-    version_to_check_int = parse_version(version_to_check)
+    version_to_check_parsed = parse_version(version_to_check)
     min_ver = parse_version(version_from_config["minimum"])
     max_ver = parse_version(version_from_config["maximum"])
-    if (min_ver > version_to_check_int) or (max_ver < version_to_check_int):
-        sys.exit(
-            "Incompatible version of GaNDLF detected ("
-            + str(version_to_check_int)
-            + ")"
-        )
+    if not (min_ver <= version_to_check_parsed <= max_ver):
+        sys.exit("Incompatible version of GaNDLF detected (" + version_to_check + ")")
 
     return True
 
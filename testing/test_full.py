@@ -1,5 +1,5 @@
 from pathlib import Path
-import gdown, zipfile, os, csv, random, copy, shutil, yaml, torch, pytest
+import gdown, zipfile, os, csv, random, copy, shutil, yaml, torch, pytest, pickle
 import SimpleITK as sitk
 import numpy as np
 import pandas as pd
@@ -10,6 +10,7 @@ import cv2
 from GANDLF.data.ImagesFromDataFrame import ImagesFromDataFrame
 from GANDLF.utils import *
 from GANDLF.utils import parseTestingCSV, get_tensor_from_image
+from GANDLF.utils.generic import parse_version
 from GANDLF.data.preprocessing import global_preprocessing_dict
 from GANDLF.data.augmentation import global_augs_dict
 from GANDLF.data.patch_miner.opm.utils import (
@@ -1345,6 +1346,168 @@ def test_generic_config_read():
     print("passed")
 
 
+def test_generic_version_check():
+    print("24_1: Starting testing version check")
+    expected_version = (0, 0, 19)
+    assert parse_version("0.0.19") == expected_version, "version parsing failed"
+    assert parse_version("0.0.19-dev") == expected_version, "'-dev' parsing failed"
+    # importlib.metadata reports development versions with a fourth component
+    assert parse_version("0.0.19.dev0") == expected_version, "4-part parsing failed"
+    assert parse_version("0.1.0") > parse_version("0.0.19"), "version ordering failed"
+
+    version_from_config = {"minimum": "0.0.18", "maximum": "0.1.0"}
+    # the components need to be compared individually, not as a concatenated integer
+    assert version_check(version_from_config, "0.0.19"), "version check failed"
+    assert version_check(version_from_config, "0.0.19-dev"), "version check failed"
+    assert version_check(version_from_config, "0.0.19.dev0"), "version check failed"
+    assert version_check(
+        {"minimum": "0.0.18-dev", "maximum": "0.0.18-dev"}, "0.0.18"
+    ), "version check failed"
+
+    with pytest.raises(SystemExit) as exc_info:
+        version_check(version_from_config, "0.1.1-dev")
+    assert (
+        str(exc_info.value) == "Incompatible version of GaNDLF detected (0.1.1-dev)"
+    ), "version check message is incorrect"
+    with pytest.raises(SystemExit) as exc_info:
+        version_check(version_from_config, "0.0.17.dev0")
+    assert "(0.0.17.dev0)" in str(
+        exc_info.value
+    ), "version check message does not show the version"
+
+    print("passed")
+
+
+def test_generic_config_read_cached():
+    print("24_2: Starting testing cached reading of configuration")
+    ConfigManager.cache_clear()
+    file_config = os.path.join(testingDir, "config_segmentation.yaml")
+    parameters = ConfigManager(file_config, version_check_flag=False)
+    parameters_cached = ConfigManager(file_config, version_check_flag=False)
+    assert parameters == parameters_cached, "cached parameters do not match"
+    assert (
+        parameters is not parameters_cached
+    ), "cached parameters should not be shared between calls"
+
+    # modifying the returned parameters should not affect later calls
+    parameters["model"]["architecture"] = "modified_architecture"
+    parameters_cached = ConfigManager(file_config, version_check_flag=False)
+    assert (
+        parameters_cached["model"]["architecture"] != "modified_architecture"
+    ), "cached parameters were modified by caller"
+
+    # modifying the file should invalidate the cache
+    parameters = ConfigManager(file_config, version_check_flag=False)
+    parameters["num_epochs"] = parameters["num_epochs"] + 1
+    file_config_temp = write_temp_config_path(parameters)
+    parameters_first = ConfigManager(file_config_temp, version_check_flag=False)
+    parameters["num_epochs"] = parameters["num_epochs"] + 10
+    with open(file_config_temp, "w") as file:
+        yaml.dump(parameters, file)
+    parameters_second = ConfigManager(file_config_temp, version_check_flag=False)
+    assert (
+        parameters_first["num_epochs"] + 10 == parameters_second["num_epochs"]
+    ), "cache was not invalidated after the configuration file changed"
+
+    sanitize_outputDir()
+
+    print("passed")
+
+
+def test_generic_config_read_cached_sidecar(monkeypatch):
+    print("24_3: Starting testing reading configuration via the cache file")
+    # read the base config before enabling the cache so that no cache file is written in the source tree
+    parameters = ConfigManager(
+        os.path.join(testingDir, "config_segmentation.yaml"), version_check_flag=False
+    )
+    file_config_temp = write_temp_config_path(parameters)
+    file_config_cache = file_config_temp + ".cache.pkl"
+
+    # the cache file should be written and re-used across processes
+    monkeypatch.setenv("GANDLF_CONFIG_CACHE", "1")
+    ConfigManager.cache_clear()
+    parameters_first = ConfigManager(file_config_temp, version_check_flag=False)
+    assert os.path.isfile(file_config_cache), "configuration cache file was not written"
+    with open(file_config_cache, "rb") as file:
+        cache_hash_first = pickle.load(file)["h"]
+    ConfigManager.cache_clear()
+    parameters_second = ConfigManager(file_config_temp, version_check_flag=False)
+    assert (
+        parameters_first == parameters_second
+    ), "parameters from configuration cache file do not match"
+
+    # a change in the configuration file should trigger a re-parse
+    parameters["num_epochs"] = parameters["num_epochs"] + 10
+    with open(file_config_temp, "w") as file:
+        yaml.dump(parameters, file)
+    ConfigManager.cache_clear()
+    parameters_second = ConfigManager(file_config_temp, version_check_flag=False)
+    assert (
+        parameters_first["num_epochs"] + 10 == parameters_second["num_epochs"]
+    ), "configuration cache file was not invalidated after the file changed"
+    with open(file_config_cache, "rb") as file:
+        cache_hash_second = pickle.load(file)["h"]
+    assert (
+        cache_hash_first != cache_hash_second
+    ), "configuration cache file was not regenerated after the file changed"
+
+    # a corrupted cache file should be regenerated
+    with open(file_config_cache, "wb") as file:
+        file.write(b"corrupted")
+    ConfigManager.cache_clear()
+    parameters_third = ConfigManager(file_config_temp, version_check_flag=False)
+    assert (
+        parameters_second == parameters_third
+    ), "parameters do not match after a corrupted configuration cache file"
+    with open(file_config_cache, "rb") as file:
+        assert (
+            pickle.load(file)["h"] == cache_hash_second
+        ), "corrupted configuration cache file was not regenerated"
+
+    ConfigManager.cache_clear()
+    sanitize_outputDir()
+
+    print("passed")
+
+
+def test_generic_config_read_resample_minimum():
+    print("24_4: Starting testing resolution parsing for resample_minimum")
+    with open(os.path.join(testingDir, "config_segmentation.yaml"), "r") as file:
+        config_base = yaml.safe_load(file)
+
+    for resolution, expected_resolution in [
+        (2, [2, 2]),  # a single number is duplicated
+        ([2], [2, 2]),  # as is a single-element list
+        ([1, 2, 3], [1, 2, 3]),  # and a full resolution is kept as-is
+    ]:
+        config_temp = copy.deepcopy(config_base)
+        config_temp["data_preprocessing"]["resample_min"] = {"resolution": resolution}
+        parameters = ConfigManager(config_temp, version_check_flag=False)
+        assert (
+            parameters["data_preprocessing"]["resample_min"]["resolution"]
+            == expected_resolution
+        ), "resolution for 'resample_min' was not parsed correctly"
+
+    print("passed")
+
+
+def test_generic_config_read_empty_augmentation():
+    print("24_5: Starting testing parsing of empty data_augmentation")
+    with open(os.path.join(testingDir, "config_segmentation.yaml"), "r") as file:
+        config_base = yaml.safe_load(file)
+
+    # an empty 'data_augmentation:' section is parsed as None
+    for data_augmentation in [None, {}]:
+        config_temp = copy.deepcopy(config_base)
+        config_temp["data_augmentation"] = data_augmentation
+        parameters = ConfigManager(config_temp, version_check_flag=False)
+        assert parameters["data_augmentation"] == {
+            "default_probability": 0.5
+        }, "empty 'data_augmentation' was not parsed correctly"
+
+    print("passed")
+
+
 def test_generic_cli_function_preprocess():
     print("25: Starting testing cli function preprocess")
     file_config = os.path.join(testingDir, "config_segmentation.yaml")